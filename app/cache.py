@@ -0,0 +1,49 @@
+# app/cache.py
+import asyncio
+import os
+from typing import Any, Optional
+import logging
+
+try:
+    import diskcache
+except ImportError: # cache becomes a no-op without diskcache installed
+    diskcache = None
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.getenv("SPEC_CACHE_DIR", "./.cache")
+DEFAULT_TTL = 604800  # 7 days
+
+if diskcache is not None:
+    _cache = diskcache.FanoutCache(CACHE_DIR)
+else:
+    _cache = None
+    logger.warning("diskcache not installed, persistent result cache disabled")
+
+
+async def get(key: str) -> Optional[Any]:
+    """
+    Look up a cached value by key; returns None on miss, expiry, or when
+    the cache backend is unavailable
+    """
+    if _cache is None:
+        return None
+
+    try:
+        return await asyncio.to_thread(_cache.get, key)
+    except Exception as e:
+        logger.warning("Cache read failed for %s: %s", key, e)
+        return None
+
+
+async def set(key: str, value: Any, ttl: int = DEFAULT_TTL) -> None:
+    """
+    Store a value under key with a TTL in seconds
+    """
+    if _cache is None:
+        return
+
+    try:
+        await asyncio.to_thread(_cache.set, key, value, ttl)
+    except Exception as e:
+        logger.warning("Cache write failed for %s: %s", key, e)
@@ -1,9 +1,13 @@
 # app/main.py
-from fastapi import FastAPI, HTTPException
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
 from typing import Dict, Any, List # <-- Add List to the import
+import httpx
 import json
 import logging
 import os
@@ -12,14 +16,32 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
-from .llm_client import generate_test_cases
+from .llm_client import generate_test_cases, create_cached_content, spec_fingerprint
 from .utils import preprocess_openapi_spec
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="API Test Case Generator", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Shared HTTP client: keep-alive connections to the Gemini API avoid a
+    # fresh TCP+TLS handshake on every /generate-tests call
+    app.state.http_client = httpx.AsyncClient(
+        timeout=120.0,
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        headers={"Content-Type": "application/json"}
+    )
+    # CPU pool for spec preprocessing so large specs don't block the event loop
+    app.state.cpu_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    # Upload the static prompt prefix to Gemini's server-side prompt cache
+    await create_cached_content(app.state.http_client)
+    yield
+    app.state.cpu_pool.shutdown(wait=False)
+    await app.state.http_client.aclose()
+
+app = FastAPI(title="API Test Case Generator", version="1.0.0", lifespan=lifespan)
 
 # Mount static files for frontend
 app.mount("/static", StaticFiles(directory="frontend"), name="static")
@@ -37,8 +59,26 @@ async def root():
     """Serve the main frontend page"""
     return FileResponse("frontend/index.html")
 
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    RFC 7232 If-None-Match check against a quoted ETag: handles *,
+    comma-separated lists, and weak (W/) validators via weak comparison
+    """
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = etag.strip('"')
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate.strip('"') == opaque:
+            return True
+
+    return False
+
 @app.post("/generate-tests", response_model=TestCaseResponse)
-async def generate_tests(request: OpenAPIRequest):
+async def generate_tests(request: OpenAPIRequest, http_request: Request, response: Response):
     """
     Generate test cases from OpenAPI specification
     """
@@ -49,17 +89,33 @@ async def generate_tests(request: OpenAPIRequest):
         
         logger.info("Processing OpenAPI specification...")
         
-        # Preprocess the OpenAPI spec
-        processed_spec = preprocess_openapi_spec(request.openapi_spec)
+        # Preprocess the OpenAPI spec off the event loop: in the CPU pool
+        # when the lifespan set one up, else in a worker thread
+        cpu_pool = getattr(app.state, "cpu_pool", None)
+        if cpu_pool is not None:
+            loop = asyncio.get_running_loop()
+            processed_spec = await loop.run_in_executor(
+                cpu_pool, preprocess_openapi_spec, request.openapi_spec
+            )
+        else:
+            processed_spec = await asyncio.to_thread(preprocess_openapi_spec, request.openapi_spec)
         
         if not processed_spec:
             raise HTTPException(status_code=400, detail="Invalid or empty OpenAPI specification")
         
-        logger.info(f"Found {len(processed_spec.get('endpoints', []))} endpoints")
-        
+        logger.info("Found %d endpoints", len(processed_spec.get("endpoints", [])))
+
+        # ETag short-circuit: CI pipelines re-POST identical specs; a
+        # matching If-None-Match skips generation and the response body
+        etag = f'"{spec_fingerprint(processed_spec)}"'
+        if_none_match = http_request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
         # Generate test cases using LLM
-        test_cases = await generate_test_cases(processed_spec)
-        
+        test_cases = await generate_test_cases(processed_spec, app.state.http_client)
+
+        response.headers["ETag"] = etag
         return TestCaseResponse(
             test_cases=test_cases,
             status="success",
@@ -69,7 +125,7 @@ async def generate_tests(request: OpenAPIRequest):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error generating test cases: {str(e)}")
+        logger.error("Error generating test cases: %s", e)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 @app.get("/health")
@@ -82,8 +138,7 @@ async def test_gemini():
     """Simple test endpoint for Gemini API"""
     try:
         from .llm_client import GEMINI_API_KEY, GEMINI_API_URL
-        import httpx
-        
+
         if GEMINI_API_KEY == "your-gemini-api-key-here":
             return {"error": "Gemini API key not configured"}
         
@@ -101,21 +156,30 @@ async def test_gemini():
             }
         }
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{GEMINI_API_URL}?key={GEMINI_API_KEY}",
-                json=payload
-            )
-            
-            result = response.json()
-            return {
-                "status_code": response.status_code,
-                "response": result
-            }
+        response = await app.state.http_client.post(
+            f"{GEMINI_API_URL}?key={GEMINI_API_KEY}",
+            json=payload
+        )
+
+        result = response.json()
+        return {
+            "status_code": response.status_code,
+            "response": result
+        }
             
     except Exception as e:
         return {"error": str(e)}
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # uvloop/httptools (bundled with uvicorn[standard]) replace asyncio's
+    # pure-Python loop and HTTP parser; the import string lets WORKERS
+    # pre-fork across cores, each worker with its own loop
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WORKERS", "1"))
+    )
\ No newline at end of file
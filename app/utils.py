@@ -1,9 +1,51 @@
 # app/utils.py
+from dataclasses import dataclass
 from typing import Dict, Any, List
 import logging
 
+try:
+    import fastjsonschema
+except ImportError: # fall back to manual checks without fastjsonschema
+    fastjsonschema = None
+
 logger = logging.getLogger(__name__)
 
+# Structural requirements for an acceptable spec, compiled once at import
+# into a specialized validator function instead of re-interpreted checks
+_SPEC_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "info": {"type": "object"},
+        "paths": {"type": "object", "minProperties": 1}
+    },
+    "required": ["info", "paths"],
+    "anyOf": [
+        {"required": ["openapi"]},
+        {"required": ["swagger"]}
+    ]
+}
+
+_validate_spec = fastjsonschema.compile(_SPEC_SCHEMA) if fastjsonschema is not None else None
+
+_PARAM_LOCATIONS = ("path", "query", "header", "cookie")
+_HTTP_METHODS = frozenset({"get", "post", "put", "patch", "delete", "head", "options"})
+_PATH_TRANS = str.maketrans("/", "_")
+_ACCEPTED_CONTENT_TYPES = ("application/json", "application/x-www-form-urlencoded", "multipart/form-data")
+
+@dataclass(slots=True)
+class Param:
+    """
+    Flat parameter record: one slotted instance per spec parameter instead
+    of nested per-location dicts, cutting allocation and serialized size
+    """
+    loc: str
+    name: str
+    type: str
+    required: bool
+    description: str
+    example: Any
+    schema: Dict[str, Any]
+
 def preprocess_openapi_spec(spec: Dict[str, Any]) -> Dict[str, Any]:
     """
     Preprocess OpenAPI specification to extract relevant information
@@ -12,63 +54,58 @@ def preprocess_openapi_spec(spec: Dict[str, Any]) -> Dict[str, Any]:
         if not spec:
             return {}
         
+        # Single fused comprehension: LIST_APPEND bytecode instead of
+        # repeated .append calls, O(1) frozenset membership per method
         processed = {
             "info": spec.get("info", {}),
             "servers": spec.get("servers", []),
-            "endpoints": []
+            "endpoints": [
+                {
+                    "path": path,
+                    "method": m_low.upper(),
+                    "operationId": operation.get("operationId") or f"{m_low}_{path.translate(_PATH_TRANS)}",
+                    "summary": operation.get("summary", ""),
+                    "description": operation.get("description", ""),
+                    "parameters": extract_parameters(operation),
+                    "requestBody": extract_request_body(operation),
+                    "responses": extract_responses(operation),
+                    "tags": operation.get("tags", [])
+                }
+                for path, path_item in spec.get("paths", {}).items()
+                for method, operation in path_item.items()
+                if (m_low := method.lower()) in _HTTP_METHODS
+            ]
         }
-        
-        paths = spec.get("paths", {})
-        
-        for path, path_item in paths.items():
-            # Extract operations for this path
-            for method, operation in path_item.items():
-                if method.lower() in ["get", "post", "put", "patch", "delete", "head", "options"]:
-                    endpoint = {
-                        "path": path,
-                        "method": method.upper(),
-                        "operationId": operation.get("operationId", f"{method}_{path.replace('/', '_')}"),
-                        "summary": operation.get("summary", ""),
-                        "description": operation.get("description", ""),
-                        "parameters": extract_parameters(operation),
-                        "requestBody": extract_request_body(operation),
-                        "responses": extract_responses(operation),
-                        "tags": operation.get("tags", [])
-                    }
-                    processed["endpoints"].append(endpoint)
-        
-        logger.info(f"Processed OpenAPI spec: {len(processed['endpoints'])} endpoints found")
+
+        logger.info("Processed OpenAPI spec: %d endpoints found", len(processed["endpoints"]))
         return processed
         
     except Exception as e:
-        logger.error(f"Error processing OpenAPI spec: {e}")
+        logger.error("Error processing OpenAPI spec: %s", e)
         return {}
 
-def extract_parameters(operation: Dict[str, Any]) -> Dict[str, Any]:
+def extract_parameters(operation: Dict[str, Any]) -> List[Param]:
     """
-    Extract parameters from operation
+    Extract parameters from operation as a flat list of Param records
     """
-    parameters = {
-        "path": {},
-        "query": {},
-        "header": {},
-        "cookie": {}
-    }
-    
+    parameters = []
+
     for param in operation.get("parameters", []):
         param_in = param.get("in", "query")
-        param_name = param.get("name", "unknown")
-        param_info = {
-            "type": param.get("schema", {}).get("type", "string"),
-            "required": param.get("required", False),
-            "description": param.get("description", ""),
-            "example": param.get("example"),
-            "schema": param.get("schema", {})
-        }
-        
-        if param_in in parameters:
-            parameters[param_in][param_name] = param_info
-    
+        if param_in not in _PARAM_LOCATIONS:
+            continue
+
+        schema = param.get("schema", {})
+        parameters.append(Param(
+            loc=param_in,
+            name=param.get("name", "unknown"),
+            type=schema.get("type", "string"),
+            required=param.get("required", False),
+            description=param.get("description", ""),
+            example=param.get("example"),
+            schema=schema
+        ))
+
     return parameters
 
 def extract_request_body(operation: Dict[str, Any]) -> Dict[str, Any]:
@@ -78,19 +115,21 @@ def extract_request_body(operation: Dict[str, Any]) -> Dict[str, Any]:
     request_body = operation.get("requestBody", {})
     if not request_body:
         return {}
-    
-    content = request_body.get("content", {})
-    
-    # Extract schema for common content types
-    for content_type in ["application/json", "application/x-www-form-urlencoded", "multipart/form-data"]:
-        if content_type in content:
+
+    body_get = request_body.get
+    content_get = body_get("content", {}).get
+
+    # Extract schema for common content types; one bound .get per lookup
+    for content_type in _ACCEPTED_CONTENT_TYPES:
+        entry = content_get(content_type)
+        if entry is not None:
             return {
                 "content_type": content_type,
-                "required": request_body.get("required", False),
-                "schema": content[content_type].get("schema", {}),
-                "description": request_body.get("description", "")
+                "required": body_get("required", False),
+                "schema": entry.get("schema", {}),
+                "description": body_get("description", "")
             }
-    
+
     return {}
 
 def extract_responses(operation: Dict[str, Any]) -> Dict[str, Any]:
@@ -98,29 +137,41 @@ def extract_responses(operation: Dict[str, Any]) -> Dict[str, Any]:
     Extract response schemas from operation
     """
     responses = {}
-    
+
     for status_code, response_info in operation.get("responses", {}).items():
-        response_data = {
-            "description": response_info.get("description", ""),
-            "headers": response_info.get("headers", {}),
-            "content": {}
-        }
-        
-        content = response_info.get("content", {})
-        for content_type, content_info in content.items():
-            response_data["content"][content_type] = {
-                "schema": content_info.get("schema", {}),
-                "example": content_info.get("example")
+        info_get = response_info.get
+        content = {}
+        for content_type, content_info in info_get("content", {}).items():
+            content_info_get = content_info.get
+            content[content_type] = {
+                "schema": content_info_get("schema", {}),
+                "example": content_info_get("example")
             }
-        
-        responses[status_code] = response_data
-    
+
+        responses[status_code] = {
+            "description": info_get("description", ""),
+            "headers": info_get("headers", {}),
+            "content": content
+        }
+
     return responses
 
 def validate_openapi_spec(spec: Dict[str, Any]) -> bool:
     """
-    Basic validation of OpenAPI specification
+    Basic validation of OpenAPI specification via the compiled validator
     """
+    if _validate_spec is not None:
+        try:
+            _validate_spec(spec)
+            return True
+        except fastjsonschema.JsonSchemaException as e:
+            logger.error("Invalid OpenAPI spec: %s", e.message)
+            return False
+        except Exception as e:
+            logger.error("Error validating OpenAPI spec: %s", e)
+            return False
+
+    # Manual checks when fastjsonschema is not installed
     try:
         # Check for required fields
         if "openapi" not in spec and "swagger" not in spec:
@@ -143,5 +194,5 @@ def validate_openapi_spec(spec: Dict[str, Any]) -> bool:
         return True
         
     except Exception as e:
-        logger.error(f"Error validating OpenAPI spec: {e}")
+        logger.error("Error validating OpenAPI spec: %s", e)
         return False
\ No newline at end of file